@@ -38,7 +38,7 @@ via the XML publishing interface.
 
 :Author: `Christoph Gohlke <https://www.cgohlke.com>`_
 :License: BSD 3-Clause
-:Version: 2022.9.28
+:Version: 2026.10.15
 
 Requirements
 ------------
@@ -46,13 +46,31 @@ Requirements
 This release has been tested with the following requirements and dependencies
 (other versions may work):
 
-- `CPython 3.8.10, 3.9.13, 3.10.7, 3.11.0rc2 <https://www.python.org>`_
-- `Lxml 4.9.1 <https://pypi.org/project/lxml/>`_
+- `CPython 3.11.7 <https://www.python.org>`_
+- `Lxml 6.1.3 <https://pypi.org/project/lxml/>`_
+- `Urllib3 1.26.20, 2.8.0 <https://pypi.org/project/urllib3/>`_
+- `Numpy 2.4.6 <https://pypi.org/project/numpy/>`_ (optional)
 - `FileMaker(tm) Server 8 Advanced <https://www.claris.com/filemaker/>`_
 
 Revisions
 ---------
 
+2026.10.15
+
+- Parse FMPXMLRESULT incrementally and compile row parsers per layout.
+- Reuse HTTP connections and follow redirects (requires urllib3).
+- Add FM.close function and context manager interface.
+- Add FM.fm_batch function to submit requests concurrently.
+- Add optional memory and disk caches of find results (cachesize, cachedir,
+  and cachettl arguments).
+- Add FM.clear_cache function.
+- Add FMPXMLResult.to_numpy function.
+- Add FMField.fmtype attribute.
+- Add strip argument to escape_unicode.
+- Escape apostrophe as &#39; instead of &#x27; if quote is True (breaking).
+- FMPXMLResult.httpinfo is str instead of http.client.HTTPMessage (breaking).
+- Speed up escape_unicode.
+
 2022.9.28
 
 - Convert docstrings to Google style with Sphinx directives.
@@ -128,18 +146,26 @@ FileMaker Error 401: No records match the request
 
 from __future__ import annotations
 
-__version__ = '2022.9.28'
+__version__ = '2026.10.15'
 
 __all__ = ['FM', 'FMError', 'FMField', 'FMPXMLResult']
 
-import base64
-from html import escape
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
-from typing import Any, Iterable
+import copy
+import functools
+import math
+import operator
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote_plus, urlencode
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
 
-from lxml import etree
+if TYPE_CHECKING:
+    import numpy
+    import urllib3
+    from lxml import etree
 
 
 class FM:
@@ -154,35 +180,101 @@ class FM:
         protocol:
             Protocol used by FileMaker Web server.
             'http' (default) or 'https'.
+        cachesize:
+            Maximum number of find results cached in memory.
+            The default is 0, no caching.
+            The cache is cleared when records are created, edited, or
+            deleted via this instance.
+        cachedir:
+            Optional directory where find results are cached as pickle
+            files, for example, to reuse results across sessions.
+            Pickle files can execute arbitrary code when loaded.
+            Do not use directories writable by others.
+        cachettl:
+            Number of seconds find results are valid in `cachedir`.
+            The default is 3600.
 
     """
 
     URL = '{_protocol}://{_server}:{_port}/fmi/xml/FMPXMLRESULT.xml'
 
+    TAGS = (
+        # FMPXMLRESULT elements handled while parsing, in any namespace
+        '{*}ERRORCODE',
+        '{*}PRODUCT',
+        '{*}DATABASE',
+        '{*}FIELD',
+        '{*}METADATA',
+        '{*}ROW',
+    )
+
     _server: str
     _port: int
     _protocol: str
+    _url: str
     _escrslt: bool
     _dbname: str
     _dbuser: str
     _dbpasswd: str
+    _headers: dict[str, str]
     _dbdata: list[tuple[str, Any]]
     _dbparams: list[tuple[str, Any]]
+    _dbdata_append: Callable[[tuple[str, Any]], None]
+    _dbparams_append: Callable[[tuple[str, Any]], None]
     _maxret: int
+    _http: urllib3.PoolManager
+    _cache: OrderedDict[tuple[str, ...], FMPXMLResult]
+    _cachesize: int
+    _cachelock: threading.Lock
+    _cachedir: str | None
+    _cachettl: float
 
     def __init__(
-        self, server: str, /, port: int = 80, protocol: str = 'http'
+        self,
+        server: str,
+        /,
+        port: int = 80,
+        protocol: str = 'http',
+        cachesize: int = 0,
+        cachedir: str | os.PathLike | None = None,
+        cachettl: float = 3600,
     ) -> None:
         self._server = str(server)
         self._port = int(port)
         self._protocol = str(protocol)
+        self._url = FM.URL.format(**self.__dict__)
         self._escrslt = False
         self._dbname = ''
         self._dbuser = ''
         self._dbpasswd = ''
+        self._headers = {
+            'User-Agent': 'Fmkr.py',
+            'Authorization': 'Basic Og==',  # empty user name and password
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }
         self._dbdata = []
         self._dbparams = []
+        # bound methods; lists must be cleared, not replaced
+        self._dbdata_append = self._dbdata.append
+        self._dbparams_append = self._dbparams.append
         self._maxret = 50
+        # reuse connections to server across requests
+        import urllib3
+
+        # follow redirects but do not retry failed requests
+        retries = urllib3.Retry(total=None, connect=0, read=0, redirect=5)
+        self._http = urllib3.PoolManager(
+            num_pools=1, maxsize=4, retries=retries
+        )
+        self._cache = OrderedDict()
+        self._cachesize = max(0, int(cachesize))
+        self._cachelock = threading.Lock()
+        if cachedir is None:
+            self._cachedir = None
+        else:
+            self._cachedir = os.fspath(cachedir)
+            os.makedirs(self._cachedir, exist_ok=True)
+        self._cachettl = float(cachettl)
 
     def set_db_data(
         self, name: str, layout: str, /, maxret: int = 50, response: str = None
@@ -201,7 +293,7 @@ class FM:
                 Optional name of response layout.
 
         """
-        self._dbdata = []
+        self._dbdata.clear()
         self._dbdata_append(('-db', name))
         self._dbdata_append(('-lay', layout))
         if response:
@@ -218,8 +310,14 @@ class FM:
                 Password associated with user.
 
         """
+        import base64
+
         self._dbuser = str(username)
         self._dbpasswd = str(password)
+        # authorization header
+        userpass = f'{self._dbuser}:{self._dbpasswd}'.encode()
+        auth = base64.b64encode(userpass).decode('ascii')
+        self._headers['Authorization'] = f'Basic {auth}'
 
     def set_script(self, name: str, /, option: str | None = None) -> None:
         """Specify script to be performed on returned data set.
@@ -394,107 +492,330 @@ class FM:
         """Delete given record."""
         return self._commit('delete')
 
-    def _dbparams_append(self, arg: tuple[str, Any], /) -> None:
-        """Append arg to _dbparams."""
-        self._dbparams.append((arg[0], arg[1]))
+    def fm_batch(
+        self,
+        queries: Iterable[str | tuple[str, Iterable[tuple[str, Any]]]],
+        /,
+        maxworkers: int | None = None,
+    ) -> list[FMPXMLResult]:
+        """Submit independent requests concurrently.
 
-    def _dbdata_append(self, arg: tuple[str, Any], /) -> None:
-        """Append arg to _dbdata."""
-        self._dbdata.append((arg[0], arg[1]))
+        Preset parameters are submitted with each request.
 
-    def _commit(self, action: str, /) -> FMPXMLResult:
+        Parameters:
+            queries:
+                Sequence of actions ('find', 'findall', 'edit', 'new', or
+                'delete'), optionally paired with sequences of additional
+                (field, value) parameters, for example,
+                ``('find', [('-skip', 50)])``.
+            maxworkers:
+                Maximum number of threads used to submit requests.
+                The default is the number of connections kept alive.
+
+        Return list of FMPXMLResult instances in order of queries.
+
+        """
+        preset = self._dbparams.copy()
+        self._dbparams.clear()
+        tasks = []
+        for query in queries:
+            if isinstance(query, str):
+                tasks.append((query, preset))
+            else:
+                action, params = query
+                tasks.append((action, preset + list(params)))
+        if maxworkers is None:
+            maxworkers = self._http.connection_pool_kw['maxsize']
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=maxworkers) as executor:
+            futures = [
+                executor.submit(self._commit, action, params)
+                for action, params in tasks
+            ]
+            return [future.result() for future in futures]
+
+    def clear_cache(self) -> None:
+        """Remove all cached find results from memory and cache directory."""
+        with self._cachelock:
+            self._cache.clear()
+        if self._cachedir is not None:
+            import glob
+
+            for filename in glob.glob(
+                os.path.join(self._cachedir, 'fmkr_*.pickle')
+            ):
+                try:
+                    os.remove(filename)
+                except FileNotFoundError:
+                    pass
+
+    def close(self) -> None:
+        """Close connections to FileMaker Web server kept alive."""
+        self._http.clear()
+
+    def _cache_filename(self, key: tuple[str, ...], /) -> str:
+        """Return name of file caching find result in cache directory."""
+        import hashlib
+
+        assert self._cachedir is not None
+        digest = hashlib.sha1('\n'.join(key).encode()).hexdigest()
+        return os.path.join(self._cachedir, f'fmkr_{digest}.pickle')
+
+    def _cache_get(self, key: tuple[str, ...], /) -> FMPXMLResult | None:
+        """Return copy of cached find result or None if not cached."""
+        if self._cachesize > 0:
+            with self._cachelock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+        if self._cachedir is not None:
+            import pickle
+
+            filename = self._cache_filename(key)
+            try:
+                if os.path.getmtime(filename) <= time.time() - self._cachettl:
+                    return None
+                with open(filename, 'rb') as fh:
+                    cached = pickle.load(fh)
+                if isinstance(cached, FMPXMLResult):
+                    return cached
+            except FileNotFoundError:
+                return None
+            except Exception:
+                pass
+            # remove stale or incompatible cache file
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+        return None
+
+    def _cache_put(
+        self, key: tuple[str, ...], results: FMPXMLResult, /
+    ) -> None:
+        """Cache copy of find result."""
+        if self._cachesize > 0:
+            cached = copy.deepcopy(results)
+            with self._cachelock:
+                self._cache[key] = cached
+                if len(self._cache) > self._cachesize:
+                    self._cache.popitem(last=False)
+        if self._cachedir is not None:
+            import pickle
+            import tempfile
+
+            # write to temporary file and rename atomically
+            tmpname = None
+            try:
+                fd, tmpname = tempfile.mkstemp(
+                    suffix='.tmp', prefix='fmkr_', dir=self._cachedir
+                )
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump(results, fh, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmpname, self._cache_filename(key))
+            except Exception as exc:
+                # results are valid even if they cannot be cached
+                import warnings
+
+                warnings.warn(f'failed to cache find result: {exc}')
+            finally:
+                if tmpname is not None and os.path.exists(tmpname):
+                    try:
+                        os.remove(tmpname)
+                    except OSError:
+                        pass
+
+    def _commit(
+        self, action: str, /, params: list[tuple[str, Any]] | None = None
+    ) -> FMPXMLResult:
         """Submit request to FileMaker XML publishing interface.
 
+        Parameters:
+            action:
+                FileMaker XML publishing interface command.
+            params:
+                Parameters to submit. By default, submit and clear preset
+                parameters.
+
         Return FMPXMLResult instance.
 
         """
-        self._dbparams_append(('-max', self._maxret))
+        import urllib3
+        from lxml import etree
 
-        url = FM.URL.format(**self.__dict__)
-        data = urlencode(self._dbdata + self._dbparams) + '&-' + action
-        self._dbparams = []
-        # use POST to submit data
-        request = Request(url, data.encode('ascii'))
-        request.add_header('User-Agent', 'Fmkr.py')
-        # authorization header
-        auth = f'{self._dbuser}:{self._dbpasswd}'
-        auth = 'Basic ' + base64.b64encode(auth.encode()).decode('ascii')
-        request.add_header('Authorization', auth)
+        if params is None:
+            params = self._dbparams.copy()
+            self._dbparams.clear()
+        else:
+            params = params.copy()
+        maxret = self._maxret
+        params.append(('-max', maxret))
+
+        url = self._url
+        # encode POST data
+        body = bytearray()
+        for items in (self._dbdata, params):
+            for key, value in items:
+                if not isinstance(value, (str, bytes)):
+                    value = str(value)
+                body += quote_plus(str(key)).encode('ascii')
+                body += b'='
+                body += quote_plus(value).encode('ascii')
+                body += b'&'
+        body += b'-'
+        body += action.encode('ascii')
+        data = body.decode('ascii')
+
+        cachekey = None
+        if action in ('find', 'findall'):
+            if self._cachesize > 0 or self._cachedir is not None:
+                import hashlib
+
+                # results depend on request, credentials, and escaping
+                auth = self._headers['Authorization'].encode('ascii')
+                cachekey = (
+                    url,
+                    data,
+                    hashlib.sha256(auth).hexdigest(),
+                    str(self._escrslt),
+                )
+                cached = self._cache_get(cachekey)
+                if cached is not None:
+                    return cached
+        else:
+            # records may change
+            self.clear_cache()
 
+        # use POST to submit data
         try:
-            fd = urlopen(request)
-        except HTTPError as exc:
-            raise FMError(str(exc))
-        except URLError as exc:
-            raise FMError(f'URL Error: {exc.reason}')
+            response = self._http.request(
+                'POST',
+                url,
+                body=bytes(body),
+                headers=self._headers,
+                preload_content=False,
+            )
+        except urllib3.exceptions.HTTPError as exc:
+            raise FMError(f'URL Error: {exc}')
+        if response.status >= 400:
+            response.drain_conn()
+            response.release_conn()
+            raise FMError(f'HTTP Error {response.status}: {response.reason}')
 
         results = FMPXMLResult()
-        results.httpinfo = fd.info()
+        results.httpinfo = ''.join(
+            f'{key}: {value}\n' for key, value in response.headers.items()
+        )
         results.url = url + '?' + data
+        results.errorcode = -1
         # hide logon information
         # if self._dbuser and self._dbpasswd:
         #     results.url = results.url.replace(
         #         "//", f"//{self._dbuser}:{self._dbpasswd}@", 1)
-        root = etree.parse(fd).getroot()
-        fd.close()
 
-        # <ERRORCODE>0</ERRORCODE>
+        metadata = results.metadata
+        resultset = results.resultset
+        escrslt = self._escrslt
+        converters: list[tuple[str, bool, Callable[[str], Any]]] = []
+        row_to_record = functools.partial(parse_row, converters=converters)
+        nrecords = 0
         try:
-            results.errorcode = int(root[0].text)
-        except Exception:
-            results.errorcode = -1
+            # parse response incrementally and discard processed rows
+            for _, elem in etree.iterparse(
+                response,
+                events=('end',),
+                tag=FM.TAGS,
+                remove_blank_text=True,
+                remove_comments=True,
+                remove_pis=True,
+                resolve_entities=False,
+                huge_tree=True,
+            ):
+                # local name of '{namespace}TAG'
+                tag = elem.tag.rpartition('}')[2]
+                if tag == 'ROW':
+                    # <ROW MODID="1" RECORDID="1"><COL><DATA>
+                    if nrecords == 0:
+                        # preallocate result set from number of found records
+                        # <RESULTSET FOUND="1">
+                        try:
+                            size = min(
+                                int(elem.getparent().attrib['FOUND']),
+                                int(maxret),
+                            )
+                        except (AttributeError, KeyError, ValueError):
+                            size = 0
+                        resultset.extend([None] * size)
+                    record = row_to_record(elem)
+                    if nrecords < len(resultset):
+                        resultset[nrecords] = record
+                    else:
+                        resultset.append(record)
+                    nrecords += 1
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                elif tag == 'FIELD':
+                    # <FIELD EMPTYOK="YES" MAXREPEAT="1" NAME="NAME"
+                    #        TYPE="TEXT"/>
+                    metadata.append(FMField(elem.attrib))
+                elif tag == 'METADATA':
+                    # field name, non-repeating, and conversion function
+                    for md in metadata:
+                        if escrslt and md.dtype is str:
+                            convert_type = escape_unicode
+                        else:
+                            convert_type = md.dtype
+                        converters.append(
+                            (md.name, md.maxrepeat == 1, convert_type)
+                        )
+                    row_to_record = row_parser(converters)
+                elif tag == 'ERRORCODE':
+                    # <ERRORCODE>0</ERRORCODE>
+                    try:
+                        results.errorcode = int(elem.text)
+                    except Exception:
+                        results.errorcode = -1
+                    if results.errorcode != 0:
+                        raise FMError(results.errorcode)
+                elif tag == 'PRODUCT':
+                    # <PRODUCT BUILD="06/14/2006"
+                    #          NAME="FileMaker Web Publishing Engine"
+                    #          VERSION="8.0.4.128"/>
+                    results.product.update(elem.attrib)
+                elif tag == 'DATABASE':
+                    # <DATABASE DATEFORMAT="MM/dd/yyyy" LAYOUT="data entry"
+                    #           NAME="Test" RECORDS="68"
+                    #           TIMEFORMAT="HH:mm:ss"/>
+                    results.database.update(elem.attrib)
+        finally:
+            # return connection to pool
+            response.drain_conn()
+            response.release_conn()
+
         if results.errorcode != 0:
             raise FMError(results.errorcode)
+        del resultset[nrecords:]
 
-        # <PRODUCT BUILD="06/14/2006" NAME="FileMaker Web Publishing Engine"
-        #          VERSION="8.0.4.128"/>
-        results.product.update(root[1].attrib)
+        if cachekey is not None:
+            self._cache_put(cachekey, results)
 
-        # <DATABASE DATEFORMAT="MM/dd/yyyy" LAYOUT="data entry"
-        #           NAME="Test" RECORDS="68" TIMEFORMAT="HH:mm:ss"/>
-        results.database.update(root[2].attrib)
-
-        # <METADATA>
-        metadata = results.metadata
-        for field in root[3]:
-            metadata.append(FMField(field.attrib))
+        return results
 
-        # <RESULTSET>
-        escrslt = self._escrslt
-        for row in root[4]:
-            record = {
-                'MODID': int(row.attrib['MODID']),
-                'RECORDID': int(row.attrib['RECORDID']),
-            }
-            for md, cn in zip(metadata, row.iterchildren()):
-                if escrslt and md.dtype == str:
-                    convert_type = escape_unicode
-                else:
-                    convert_type = md.dtype
-                if md.maxrepeat == 1:
-                    value = cn[0].text
-                    if value is not None:
-                        value = convert_type(value)
-                else:
-                    value = []
-                    for c in cn.iterchildren():
-                        v = c.text
-                        if v is None:
-                            break
-                        value.append(convert_type(v))
-                record[md.name] = value
-            results.resultset.append(record)
+    def __enter__(self) -> FM:
+        return self
 
-        return results
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def __repr__(self) -> str:
         params = urlencode(self._dbdata + self._dbparams)
         if params:
             params = '&' + params
-        return (
-            f"<{self.__class__.__name__} '"
-            f"{FM.URL.format(**self.__dict__)}{params}'>"
-        )
+        return f"<{self.__class__.__name__} '{self._url}{params}'>"
 
 
 class FMPXMLResult:
@@ -546,6 +867,62 @@ class FMPXMLResult:
         """Return record from resultset."""
         return self.resultset[key]
 
+    def to_numpy(self) -> numpy.ndarray:
+        """Return records as NumPy structured array.
+
+        Values of NUMBER fields are converted to float64, using NaN for
+        empty and non-numeric values. Other fields are stored as Unicode
+        strings. Repeating fields are stored as sub-arrays of length
+        `maxrepeat`.
+
+        Like in the record dictionaries, the last of several fields with the
+        same name, including 'MODID' and 'RECORDID', takes precedence.
+
+        """
+        import numpy
+
+        def number(value: str | None, /) -> float:
+            try:
+                return float(value)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                return math.nan
+
+        def text(value: str | None, /) -> str:
+            return '' if value is None else value
+
+        records = self.resultset
+        columns = {
+            'MODID': numpy.array([r['MODID'] for r in records], 'i8'),
+            'RECORDID': numpy.array([r['RECORDID'] for r in records], 'i8'),
+        }
+        for md in self.metadata:
+            if md.fmtype == 'NUMBER':
+                dtype: Any = numpy.float64
+                convert = number
+            else:
+                dtype = numpy.str_
+                convert = text
+            if md.maxrepeat == 1:
+                shape: tuple[int, ...] = (len(records),)
+                column = [convert(r.get(md.name)) for r in records]
+            else:
+                shape = (len(records), md.maxrepeat)
+                column = []
+                for record in records:
+                    values = list(record.get(md.name) or ())
+                    values += [None] * (md.maxrepeat - len(values))
+                    column.append([convert(v) for v in values])
+            array = numpy.array(column, dtype).reshape(shape)
+            columns[md.name] = array
+
+        result = numpy.empty(
+            len(records),
+            [(n, a.dtype, a.shape[1:]) for n, a in columns.items()],
+        )
+        for name, array in columns.items():
+            result[name] = array
+        return result
+
     def __repr__(self) -> str:
         if self.errorcode:
             info = f' {FMError.CODES[self.errorcode]!r}'
@@ -574,7 +951,7 @@ class FMField:
 
     """
 
-    __slots__ = ('name', 'maxrepeat', 'emptyok', 'dtype')
+    __slots__ = ('name', 'maxrepeat', 'emptyok', 'dtype', 'fmtype')
 
     DTYPES: dict[str, type] = {
         # map FileMaker to Python types
@@ -588,10 +965,14 @@ class FMField:
         'SUMMARY': str,
     }
 
+    _ATTRIBUTES = operator.itemgetter('NAME', 'MAXREPEAT', 'EMPTYOK', 'TYPE')
+
     name: str
     """Field name."""
     dtype: type
     """Field type."""
+    fmtype: str
+    """FileMaker field type, for example, 'TEXT' or 'NUMBER'."""
     emptyok: bool
     """Field may be left empty."""
     maxrepeat: int
@@ -599,10 +980,13 @@ class FMField:
 
     def __init__(self, attributes: dict[str, str], /) -> None:
         # <FIELD EMPTYOK="YES" MAXREPEAT="1" NAME="NAME" TYPE="TEXT"/>
-        self.name = attributes['NAME']
-        self.maxrepeat = int(attributes['MAXREPEAT'])
-        self.emptyok = attributes['EMPTYOK'] == 'YES'
-        self.dtype = FMField.DTYPES.get(attributes['TYPE'], str)
+        name, maxrepeat, emptyok, fmtype = FMField._ATTRIBUTES(attributes)
+        # field names are used as keys of all records
+        self.name = sys.intern(name)
+        self.maxrepeat = int(maxrepeat)
+        self.emptyok = emptyok == 'YES'
+        self.fmtype = fmtype
+        self.dtype = FMField.DTYPES.get(fmtype, str)
 
     def __repr__(self) -> str:
         return (
@@ -881,33 +1265,184 @@ class FMError(Exception):
         '(for example, the certificate has expired)',
     }
 
+    _DEFAULT_MESSAGE = f'FileMaker Error -1: {CODES[-1]}'
+
     code: int
     """Error code number."""
 
     def __init__(self, error: str | int = -1, /):
         if isinstance(error, int):
             self.code = error
-            message = FMError.CODES.get(self.code, 'Unknown error code')
-            error = f'FileMaker Error {self.code}: {message}'
+            if error == -1:
+                error = FMError._DEFAULT_MESSAGE
+            else:
+                message = FMError.CODES.get(error, 'Unknown error code')
+                error = f'FileMaker Error {error}: {message}'
         else:
             self.code = -1
         super().__init__(error)
 
 
-def escape_unicode(ustr: str, /, quote: bool = True) -> str:
+class _EscapeTable(dict):
+    """Table for str.translate to escape markup and non-ASCII characters.
+
+    Non-ASCII characters are replaced by decimal character references,
+    which are added to the table on first use.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, escapes: dict[str, str], /) -> None:
+        super().__init__((i, chr(i)) for i in range(128))
+        self.update(str.maketrans(escapes))
+
+    def __missing__(self, key: int, /) -> str:
+        value = f'&#{key};'
+        self[key] = value
+        return value
+
+
+_ESCAPE_TABLE = _EscapeTable(
+    {'&': '&amp;', '<': '&lt;', '>': '&gt;', "'": '&#39;'}
+)
+
+_ESCAPE_QUOTE_TABLE = _EscapeTable(
+    {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}
+)
+
+
+def escape_unicode(
+    ustr: str, /, quote: bool = True, strip: bool = True
+) -> str:
     """Return ASCII string for use in XHTML from unicode string.
 
     Parameters:
         ustr: Unicode string to escape.
         quote: Translate quotation mark characters.
+        strip: Remove leading and trailing whitespace.
+
+    """
+    if strip:
+        ustr = ustr.strip()
+    if (
+        ustr.isascii()
+        and '&' not in ustr
+        and '<' not in ustr
+        and '>' not in ustr
+        and "'" not in ustr
+        and (not quote or '"' not in ustr)
+    ):
+        # quick check: nothing to escape
+        return ustr
+    return ustr.translate(_ESCAPE_QUOTE_TABLE if quote else _ESCAPE_TABLE)
+
+
+def parse_row(
+    row: etree._Element,
+    /,
+    converters: Sequence[tuple[str, bool, Callable[[str], Any]]],
+) -> dict[str, Any]:
+    """Return record from FMPXMLRESULT ROW element.
+
+    Parameters:
+        row:
+            ROW element.
+        converters:
+            Field name, whether field is non-repeating, and function to
+            convert field data for each column.
 
     """
-    return (
-        escape(ustr.strip(), quote=quote)
-        .encode('ascii', 'xmlcharrefreplace')
-        .replace(b"'", b'&#39;')
-        .decode('ascii')
+    record = {
+        'MODID': int(row.attrib['MODID']),
+        'RECORDID': int(row.attrib['RECORDID']),
+    }
+    for (name, single, convert_type), cn in zip(
+        converters, row.iterchildren()
+    ):
+        if single:
+            value = cn[0].text
+            if value is not None:
+                value = convert_type(value)
+        else:
+            value = []
+            for c in cn.iterchildren():
+                v = c.text
+                if v is None:
+                    break
+                value.append(convert_type(v))
+        record[name] = value
+    return record
+
+
+def row_parser(
+    converters: Sequence[tuple[str, bool, Callable[[str], Any]]], /
+) -> Callable[[etree._Element], dict[str, Any]]:
+    """Return function specialized to parse ROW elements of result set.
+
+    The returned function is equivalent to :py:func:`parse_row` but compiled
+    for the given converters, without loops and branches over fields.
+
+    Parameters:
+        converters:
+            Field name, whether field is non-repeating, and function to
+            convert field data for each column.
+
+    Functions for recent converters are cached.
+
+    """
+    return _row_parser(tuple(converters))
+
+
+@functools.lru_cache(maxsize=64)
+def _row_parser(
+    converters: tuple[tuple[str, bool, Callable[[str], Any]], ...], /
+) -> Callable[[etree._Element], dict[str, Any]]:
+    """Return function specialized to parse ROW elements of result set."""
+    args = ['row', '_converters=_converters', '_parse_row=_parse_row']
+    body = []
+    items = []
+    for i, (name, single, _) in enumerate(converters):
+        args.append(f'_f{i}=_f{i}')
+        if single:
+            body += [
+                f'    v{i} = cols[{i}][0].text',
+                f'    if v{i} is not None:',
+                f'        v{i} = _f{i}(v{i})',
+            ]
+        else:
+            body += [
+                f'    v{i} = []',
+                f'    for c in cols[{i}]:',
+                '        v = c.text',
+                '        if v is None:',
+                '            break',
+                f'        v{i}.append(_f{i}(v))',
+            ]
+        items.append(f'        {name!r}: v{i},')
+    source = '\n'.join(
+        [
+            f'def row_to_record({", ".join(args)}):',
+            '    cols = list(row)',
+            f'    if len(cols) < {len(converters)}:',
+            '        return _parse_row(row, converters=_converters)',
+            *body,
+            '    attrib = row.attrib',
+            '    return {',
+            "        'MODID': int(attrib['MODID']),",
+            "        'RECORDID': int(attrib['RECORDID']),",
+            *items,
+            '    }',
+        ]
     )
+    namespace: dict[str, Any] = {
+        f'_f{i}': convert_type
+        for i, (_, _, convert_type) in enumerate(converters)
+    }
+    namespace['_converters'] = converters
+    namespace['_parse_row'] = parse_row
+    exec(compile(source, '<row_parser>', 'exec'), namespace)
+    return namespace['row_to_record']
 
 
 def indent(*args) -> str:
@@ -2,44 +2,40 @@
 
 """Fmkr package setuptools script."""
 
+import ast
 import sys
-import re
 
 from setuptools import setup
 
-
-def search(pattern, code, flags=0):
-    # return first match for pattern in code
-    match = re.search(pattern, code, flags)
-    if match is None:
-        raise ValueError(f'{pattern!r} not found')
-    return match.groups()[0]
-
-
 with open('fmkr/fmkr.py') as fh:
     code = fh.read()
 
-version = search(r"__version__ = '(.*?)'", code)
-
-description = search(r'"""(.*)\.(?:\r\n|\r|\n)', code)
+tree = ast.parse(code)
 
-readme = search(
-    r'(?:\r\n|\r|\n){2}"""(.*)"""(?:\r\n|\r|\n){2}[__version__|from]',
-    code,
-    re.MULTILINE | re.DOTALL,
+version = next(
+    node.value.value
+    for node in tree.body
+    if isinstance(node, ast.Assign)
+    and isinstance(node.targets[0], ast.Name)
+    and node.targets[0].id == '__version__'
 )
 
+docstring = ast.get_docstring(tree, clean=False)
+
+description = docstring.split('\n', 1)[0].rstrip('.')
+
 readme = '\n'.join(
-    [description, '=' * len(description)] + readme.splitlines()[1:]
+    [description, '=' * len(description)] + docstring.splitlines()[1:]
 )
 
-license = search(
-    r'(# Copyright.*?(?:\r\n|\r|\n))(?:\r\n|\r|\n)+""',
-    code,
-    re.MULTILINE | re.DOTALL,
-)
+lines = []
+for line in code.splitlines(keepends=True):
+    if lines and not line.startswith('#'):
+        break
+    if lines or line.startswith('# Copyright'):
+        lines.append(line)
 
-license = license.replace('# ', '').replace('#', '')
+license = ''.join(lines).replace('# ', '').replace('#', '')
 
 if 'sdist' in sys.argv:
     with open('LICENSE', 'w') as fh:
@@ -63,7 +59,8 @@ setup(
         # 'Documentation': 'https://',
     },
     packages=['fmkr'],
-    install_requires=['lxml>=4.2'],
+    install_requires=['lxml>=4.2', 'urllib3>=1.26'],
+    extras_require={'all': ['numpy']},
     python_requires='>=3.8',
     platforms=['any'],
     classifiers=[